@@ -70,6 +70,13 @@ _DOMAIN_TOOL_REGISTRY: Dict[str, Dict[str, Any]] = {
     if name in _TOOLS_REGISTRY
 }
 
+# Arg allowlists normalized once at registration: name -> (entry, frozenset(args)).
+# The entry is kept so a replaced registry entry never reuses a stale allowlist.
+_DOMAIN_TOOL_ARGS: Dict[str, Any] = {
+    name: (entry, frozenset(entry.get("args") or ()))
+    for name, entry in _DOMAIN_TOOL_REGISTRY.items()
+}
+
 
 # ------------------------------------------------------------------------------
 # Public API
@@ -168,6 +175,18 @@ def _resolve_profile(payload: Dict[str, Any]) -> Any:
     raise ValueError("MISSING_PROFILE: provide 'profile' in payload or set runtime profile")
 
 
+def _allowed_args(name: str, entry: Dict[str, Any]) -> frozenset:
+    """
+    Return a domain tool's arg allowlist as a frozenset.
+    Uses the set precomputed at registration; entries added or replaced later
+    (e.g. monkeypatched in tests) are normalized per call.
+    """
+    cached = _DOMAIN_TOOL_ARGS.get(name)
+    if cached is not None and cached[0] is entry:
+        return cached[1]
+    return frozenset(entry.get("args") or ())
+
+
 def _normalize_domain_result(result: Any) -> Dict[str, Any]:
     """
     Normalize common non-dict return types from domain tools to dicts.
@@ -268,7 +287,7 @@ def call_tool(name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         # -----------------------------------------------------------
 
         # Robust arg filtering (args may be None)
-        allowed_args = set(entry.get("args") or [])
+        allowed_args = _allowed_args(name, entry)
         kwargs = {k: v for k, v in payload.items() if k != "profile" and k in allowed_args}
 
         # Compute ignored; never count or display 'query' for extract_process
@@ -298,10 +317,18 @@ def call_tool(name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         try:
             import pandas as pd  # type: ignore
             if isinstance(result, pd.DataFrame):
+                columns = result.columns.tolist()
+                if len(result) == 0:
+                    # Empty frame: skip the record builder entirely
+                    records: List[Dict[str, Any]] = []
+                else:
+                    # to_dict boxes values to native Python types (Int64/boolean
+                    # included, pd.NA -> None) so the result stays JSON-serializable
+                    records = result.to_dict(orient="records")
                 return {
-                    "data": result.to_dict(orient="records"),   # <-- test expects 'data'
-                    "columns": list(result.columns),
-                    "shape": result.shape,                       # tuple (rows, cols); test uses shape[0]
+                    "data": records,                             # <-- test expects 'data'
+                    "columns": columns,
+                    "shape": list(result.shape),                 # [rows, cols]; test uses shape[0]
                 }
         except Exception:
             # If pandas not available or other issue, fall through to string fallback
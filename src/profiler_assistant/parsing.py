@@ -119,9 +119,15 @@ def load_and_parse_profile(file_path: str) -> Profile:
         raise FileNotFoundError(f"Profile file not found at: {file_path}")
 
     raw_data = orjson.loads(path.read_bytes())
+    return parse_profile_dict(raw_data)
 
+
+def parse_profile_dict(data: Dict[str, Any]) -> Profile:
+    """
+    Parses an already-decoded Firefox Profiler JSON dict into a Profile object.
+    """
     print("[*] Parsing and filtering raw data...")
-    profile = Profile(raw_data)
+    profile = Profile(data)
     print("[+] Parsing complete.")
 
     return profile
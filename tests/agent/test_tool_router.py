@@ -8,8 +8,20 @@ def test_list_tools_and_schema():
     names = list_tools()
     assert set(names) == {"context_summarize", "get_docs_by_id", "vector_search"}
 
-    vs = tool_schema("vector_search")
-    assert vs and vs["request_type"] == "VectorSearchRequest" and vs["response_type"] == "VectorSearchResponse"
+    schemas = {n: tool_schema(n) for n in names}
+    assert schemas["vector_search"] == {
+        "request_type": "VectorSearchRequest",
+        "response_type": "VectorSearchResponse",
+    }
+    assert schemas["get_docs_by_id"] == {
+        "request_type": "GetDocsByIdRequest",
+        "response_type": "GetDocsByIdResponse",
+    }
+    assert schemas["context_summarize"] == {
+        "request_type": "ContextSummarizeRequest",
+        "response_type": "ContextSummarizeResponse",
+    }
+    assert tool_schema("unknown") is None
 
 
 def test_call_tool_success_paths():
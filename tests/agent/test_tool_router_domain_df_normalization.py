@@ -2,6 +2,8 @@
 # - Ensure domain-tool dispatch normalizes a pandas.DataFrame return to a dict.
 # - Guards against "'dict' object is not callable" and "INVALID_RETURN" errors.
 
+import json
+
 import pandas as pd
 from profiler_assistant.agent import tool_router
 
@@ -35,3 +37,42 @@ def test_domain_tool_dataframe_is_normalized(monkeypatch):
 
     # Underlying tool was actually called
     assert calls and calls[0] is True
+
+
+def test_domain_tool_nonempty_dataframe_records(monkeypatch):
+    def fake_df_tool(profile):
+        return pd.DataFrame({"markerName": ["A", "B"], "time": [1.5, 2.0]})
+
+    monkeypatch.setitem(
+        tool_router._DOMAIN_TOOL_REGISTRY,
+        "dummy_df_tool",
+        {"function": fake_df_tool, "args": [], "description": "dummy df tool"},
+    )
+
+    out = tool_router.call_tool("dummy_df_tool", {"profile": object()})
+
+    assert out["data"] == [
+        {"markerName": "A", "time": 1.5},
+        {"markerName": "B", "time": 2.0},
+    ]
+    assert out["columns"] == ["markerName", "time"]
+    assert out["shape"] == [2, 2]
+
+
+def test_domain_tool_nullable_dtype_records_are_json_serializable(monkeypatch):
+    def fake_df_tool(profile):
+        return pd.DataFrame({
+            "pid": pd.array([1, None], dtype="Int64"),
+            "dropped": pd.array([True, None], dtype="boolean"),
+        })
+
+    monkeypatch.setitem(
+        tool_router._DOMAIN_TOOL_REGISTRY,
+        "dummy_df_tool",
+        {"function": fake_df_tool, "args": [], "description": "dummy df tool"},
+    )
+
+    out = tool_router.call_tool("dummy_df_tool", {"profile": object()})
+
+    assert out["data"] == [{"pid": 1, "dropped": True}, {"pid": None, "dropped": None}]
+    json.dumps({"tool_result": out})  # as agent/react.py does; must not raise
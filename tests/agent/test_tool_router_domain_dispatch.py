@@ -28,3 +28,35 @@ def test_domain_dispatch_calls_function(monkeypatch):
 
     assert result == {"status": "ok", "foo": 123}
     assert calls and calls[0] == ("ok", True, 123)
+
+
+def test_domain_dispatch_filters_args_by_current_allowlist(monkeypatch):
+    seen = []
+
+    def fake_tool(profile, **kwargs):
+        seen.append(kwargs)
+        return {"status": "ok"}
+
+    entry = {"function": fake_tool, "args": ["foo"], "description": "dummy"}
+    monkeypatch.setitem(tool_router._DOMAIN_TOOL_REGISTRY, "dummy_domain_tool", entry)
+
+    tool_router.call_tool("dummy_domain_tool", {"profile": object(), "foo": 1, "bar": 2})
+    assert seen[-1] == {"foo": 1}
+    assert set(entry) == {"function", "args", "description"}  # registry entry untouched
+
+    # In-place edits to 'args' take effect on the next call
+    entry["args"].append("bar")
+    tool_router.call_tool("dummy_domain_tool", {"profile": object(), "foo": 1, "bar": 2})
+    assert seen[-1] == {"foo": 1, "bar": 2}
+
+
+def test_registered_tool_allowlist_is_precomputed(monkeypatch):
+    entry = tool_router._DOMAIN_TOOL_REGISTRY["extract_process"]
+    allowed = tool_router._allowed_args("extract_process", entry)
+    assert allowed == frozenset(entry["args"])
+    assert tool_router._allowed_args("extract_process", entry) is allowed  # reused, not rebuilt
+
+    # A replaced entry must not reuse the registration-time allowlist
+    replacement = {"function": lambda profile: {}, "args": ["pid"], "description": "x"}
+    monkeypatch.setitem(tool_router._DOMAIN_TOOL_REGISTRY, "extract_process", replacement)
+    assert tool_router._allowed_args("extract_process", replacement) == frozenset({"pid"})
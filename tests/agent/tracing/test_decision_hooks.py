@@ -7,6 +7,7 @@ Verify that decision tracing produces:
 
 import re
 import time
+from collections import deque
 
 from profiler_assistant.agent.tracing.decision_hooks import (
     decision_span,
@@ -14,37 +15,51 @@ from profiler_assistant.agent.tracing.decision_hooks import (
     log_branch_choice,
 )
 
+_DURATION_RE = re.compile(r"\((\d+) ms\)")
+
 class FakeTracer:
-    """Very small tracer stub used only for tests."""
+    """
+    Very small tracer stub used only for tests.
+    Events are typed tuples, formatted only on demand via _render():
+      ("start", name) | ("end", name, dur_ms) | ("annotate", text)
+    """
     def __init__(self):
         self.stack = []
-        self.events = []
+        self.events = deque()
 
     # Span-like APIs supported by decision_hooks (one is enough).
     def start_span(self, name: str):
         self.stack.append((name, time.perf_counter()))
-        self.events.append(f"▶ {name}")
+        self.events.append(("start", name))
 
     def end_span(self):
         name, ts = self.stack.pop()
         dur_ms = int((time.perf_counter() - ts) * 1000)
-        self.events.append(f"✓ {name} ({dur_ms} ms)")
+        self.events.append(("end", name, dur_ms))
 
     def annotate(self, text: str):
-        self.events.append(text)
+        self.events.append(("annotate", text))
+
+def _render(event):
+    kind = event[0]
+    if kind == "start":
+        return f"▶ {event[1]}"
+    if kind == "end":
+        return f"✓ {event[1]} ({event[2]} ms)"
+    return event[1]
 
-def _lines_with(prefix, events):
-    return [e for e in events if e.startswith(prefix)]
+def _events_of(kind, events):
+    return [e for e in events if e[0] == kind]
 
 def test_decision_trace_has_span_and_branch_choice():
     tracer = FakeTracer()
     with decision_span(tracer, title="Decision: evaluate branching rules"):
         log_branch_choice(tracer, "Investigate Video Drops", "drops > 3 within 1s")
 
-    assert any(e.startswith("▶ Decision:") for e in tracer.events)
-    assert any(e.startswith("✓ Decision") for e in tracer.events)
+    assert any(e[1].startswith("Decision:") for e in _events_of("start", tracer.events))
+    assert any(e[1].startswith("Decision") for e in _events_of("end", tracer.events))
 
-    chosen = [e for e in tracer.events if "chosen branch:" in e]
+    chosen = [e[1] for e in _events_of("annotate", tracer.events) if "chosen branch:" in e[1]]
     assert len(chosen) == 1
     assert "↳ chosen branch: Investigate Video Drops (reason: drops > 3 within 1s)" in chosen[0]
 
@@ -53,11 +68,15 @@ def test_decision_trace_times_recorded():
     with decision_span(tracer, title="Decision"):
         time.sleep(0.005)  # minimal but non-zero
 
-    end_lines = _lines_with("✓ Decision", tracer.events)
-    assert end_lines, "No decision end line"
-    m = re.search(r"\((\d+) ms\)", end_lines[-1])
-    assert m, f"No duration in '{end_lines[-1]}'"
-    assert int(m.group(1)) >= 1  # at least 1ms
+    ends = [e for e in _events_of("end", tracer.events) if e[1].startswith("Decision")]
+    assert ends, "No decision end event"
+    assert ends[-1][2] >= 1, f"Duration too small in '{_render(ends[-1])}'"  # at least 1ms
+
+    finished = [e[1] for e in _events_of("annotate", tracer.events) if "finished" in e[1]]
+    assert finished, "No decision finished annotation"
+    m = _DURATION_RE.search(finished[-1])
+    assert m, f"No duration in '{finished[-1]}'"
+    assert int(m.group(1)) >= 1
 
 def test_rule_logging_toggle():
     tracer = FakeTracer()
@@ -65,7 +84,7 @@ def test_rule_logging_toggle():
         log_rule(tracer, "drops_in_last_second", result=True, reason="4 > 3", enabled=False)
         log_rule(tracer, "drops_in_last_second", result=True, reason="4 > 3", enabled=True)
 
-    rule_lines = [e for e in tracer.events if e.startswith("rule: ")]
+    rule_lines = [e[1] for e in _events_of("annotate", tracer.events) if e[1].startswith("rule: ")]
     assert len(rule_lines) == 1
     assert "drops_in_last_second" in rule_lines[0]
     assert "True" in rule_lines[0]
@@ -11,7 +11,6 @@ These tests monkeypatch run.py internals to avoid I/O and external calls.
 import json
 import logging
 
-import builtins
 import pytest
 
 import profiler_assistant.cli.run as run_mod
@@ -23,15 +22,16 @@ POLICY_LOG_NAME = "profiler_assistant.policy"
 
 def _fake_load_profile_from_source_factory(sequence):
     """
-    Returns a function that, on each call, pops and returns the next (profile, resolved, is_temp).
+    Returns a function that, on each call, returns the next (profile, resolved, is_temp).
     Helpful to simulate 'first run has no policy' then 'second run already has policy'.
     """
-    seq = list(sequence)
+    it = iter(tuple(sequence))
 
     def _impl(_source):
-        if not seq:
-            raise AssertionError("Test sequence exhausted; adjust your test setup.")
-        return seq.pop(0)
+        try:
+            return next(it)
+        except StopIteration:
+            raise AssertionError("Test sequence exhausted; adjust your test setup.") from None
 
     return _impl
 
@@ -41,10 +41,26 @@ def _stub_run_react_agent(profile, question, history):
     return {"final": f"[stubbed-answer] Q={question[:30]}… policy={'yes' if 'policy' in profile else 'no'}"}
 
 
+def _policy_actions(caplog, step="decide_policy"):
+    """
+    Collect the 'action=' values logged by the policy logger for `step`,
+    scanning caplog once and formatting each record's message only once.
+    """
+    marker = f"step={step} "
+    return {
+        msg.split("action=", 1)[1].split()[0]
+        for rec in caplog.records
+        if rec.name == POLICY_LOG_NAME
+        and marker in (msg := rec.getMessage())
+        and "action=" in msg
+    }
+
+
 def _seed_caplog(caplog):
+    # Capture INFO only from the policy logger; other loggers stay at their
+    # default level so caplog.records holds just what the assertions scan.
     caplog.clear()
-    caplog.set_level(logging.INFO)
-    logging.getLogger(POLICY_LOG_NAME).setLevel(logging.INFO)
+    caplog.set_level(logging.INFO, logger=POLICY_LOG_NAME)
 
 
 def test_default_to_agent_argv_basic():
@@ -74,7 +90,7 @@ def test_report_default_path_with_raw_json(monkeypatch, caplog):
     # Assert
     assert exit_code == 0
     # Policy should have been injected since it was absent
-    assert any("step=decide_policy" in rec.message and "action=inject" in rec.message for rec in caplog.records if rec.name == POLICY_LOG_NAME)
+    assert "inject" in _policy_actions(caplog)
 
 
 def test_policy_once_then_skip(monkeypatch, caplog):
@@ -88,7 +104,7 @@ def test_policy_once_then_skip(monkeypatch, caplog):
     monkeypatch.setattr(run_mod, "refresh_rag_knowledge_index", lambda: None)
     code1 = run_mod._run_report("any", policy_flag="once")
     assert code1 == 0
-    assert any("action=inject" in r.message for r in caplog.records if r.name == POLICY_LOG_NAME)
+    assert "inject" in _policy_actions(caplog)
 
     caplog.clear()
     _seed_caplog(caplog)
@@ -98,7 +114,7 @@ def test_policy_once_then_skip(monkeypatch, caplog):
     monkeypatch.setattr(run_mod, "_load_profile_from_source", _fake_load_profile_from_source_factory(seq2))
     code2 = run_mod._run_report("any", policy_flag="once")
     assert code2 == 0
-    assert any("action=skip" in r.message for r in caplog.records if r.name == POLICY_LOG_NAME)
+    assert "skip" in _policy_actions(caplog)
 
 
 def test_policy_always_reinject(monkeypatch, caplog):
@@ -112,7 +128,7 @@ def test_policy_always_reinject(monkeypatch, caplog):
 
     code = run_mod._run_report("any", policy_flag="always")
     assert code == 0
-    assert any("action=replace" in r.message for r in caplog.records if r.name == POLICY_LOG_NAME)
+    assert "replace" in _policy_actions(caplog)
 
 
 def test_no_policy_bypass(monkeypatch, caplog):
@@ -126,10 +142,10 @@ def test_no_policy_bypass(monkeypatch, caplog):
 
     code = run_mod._run_report("any", policy_flag="none")
     assert code == 0
-    assert any("action=bypass" in r.message for r in caplog.records if r.name == POLICY_LOG_NAME)
+    assert "bypass" in _policy_actions(caplog)
 
 
-def test_agent_loop_exits_immediately_on_quit(monkeypatch, caplog):
+def test_agent_loop_exits_immediately_on_quit(monkeypatch, caplog, stub_input):
     LOG.info("Start: test_agent_loop_exits_immediately_on_quit")
     _seed_caplog(caplog)
 
@@ -140,8 +156,7 @@ def test_agent_loop_exits_immediately_on_quit(monkeypatch, caplog):
     monkeypatch.setattr(run_mod, "refresh_rag_knowledge_index", lambda: None)
 
     # Simulate user typing 'exit' at first prompt
-    it = iter(["exit"])
-    monkeypatch.setattr(builtins, "input", lambda _prompt="": next(it))
+    stub_input(["exit"])
 
     code = run_mod._run_agent("any", policy_flag="once")
     assert code == 0
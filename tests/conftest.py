@@ -5,54 +5,61 @@ Pytest special file for global test configuration and fixtures.
 Registers deterministic in-memory search and docs implementations so tools
 return real, predictable results during tests.
 """
+import builtins
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+
 from profiler_assistant.rag.runtime import register_search_impl, register_docs_impl
 from tests.helpers.vector_index_fixture import make_fixture_search
 from tests.helpers.doc_store_fixture import make_fixture_docs
-
-# Search: default tiny corpus used for most tests
-_DEFAULT_CORPUS = [
-    {
-        "id": "doc:media-pipeline",
-        "text": "media playback pipeline overview and troubleshooting",
-        "meta": {"source": "docs"},
-    },
-    {
-        "id": "doc:render-thread",
-        "text": "rendering pipeline stages and frame pacing",
-        "meta": {"source": "docs"},
-    },
-    {"id": "doc:media", "text": "media audio video decoding demuxer", "meta": {"source": "notes"}},
-    {"id": "doc:unrelated", "text": "profiling tips and CLI usage", "meta": {"source": "misc"}},
-]
-
-# Docs: small parent/chunk corpus
-_DOCS_CORPUS = [
-    {"id": "doc:media", "text": "MEDIA FULL DOC", "meta": {"source": "docs", "title": "Media"}},
-    {
-        "id": "doc:media#0-10",
-        "text": "MEDIA FULL",
-        "meta": {"source": "docs", "title": "Media"},
-        "parent_id": "doc:media",
-    },
-    {
-        "id": "doc:media#10-20",
-        "text": " DOC TEXT",
-        "meta": {"source": "docs", "title": "Media"},
-        "parent_id": "doc:media",
-    },
-    {
-        "id": "doc:render-thread",
-        "text": "RENDER FULL DOC",
-        "meta": {"source": "docs", "title": "Render Thread"},
-    },
-    {
-        "id": "doc:render-thread#0-10",
-        "text": "RENDER FULL",
-        "meta": {"source": "docs", "title": "Render Thread"},
-        "parent_id": "doc:render-thread",
-    },
-]
+from tests.helpers._corpora import SEARCH_CORPUS as _DEFAULT_CORPUS, DOCS_CORPUS as _DOCS_CORPUS
 
 # Register implementations for the whole test session
 register_search_impl(make_fixture_search(_DEFAULT_CORPUS))
 register_docs_impl(make_fixture_docs(_DOCS_CORPUS))
+
+
+@pytest.fixture
+def stub_input(monkeypatch):
+    """Patch builtins.input to return the given answers in order."""
+    def apply(answers):
+        queue = deque(answers)
+        monkeypatch.setattr(builtins, "input", lambda _prompt="": queue.popleft())
+    return apply
+
+
+@pytest.fixture(scope="session")
+def dummy_backend():
+    """The embedding backend get_backend() picks with FPA_EMBEDDINGS=dummy, built once."""
+    from profiler_assistant.rag.embeddings import get_backend
+
+    # Only hold the env override while selecting the backend; leaking it for the
+    # whole session would change get_backend() for unrelated tests.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("FPA_EMBEDDINGS", "dummy")
+        backend = get_backend()
+    return backend
+
+
+@pytest.fixture
+def downloader_mocks(mocker):
+    """Response factories for the downloader's two requests.get calls."""
+    def redirect(url):
+        return mocker.Mock(status_code=200, url=url)
+
+    def download(body=b'{"meta":{}}'):
+        resp = mocker.MagicMock(status_code=200, headers={"content-length": "12345"})
+        # Usable as a context manager without swallowing exceptions.
+        resp.__enter__.return_value = resp
+        resp.__exit__.return_value = None
+        resp.iter_content.return_value = [body]
+        return resp
+
+    def install(*responses):
+        """Serve ``responses`` from requests.get in order and stub out file writes."""
+        mocker.patch("requests.get", side_effect=list(responses))
+        mocker.patch("builtins.open", mocker.mock_open())
+
+    return SimpleNamespace(redirect=redirect, download=download, install=install)
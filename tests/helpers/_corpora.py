@@ -0,0 +1,74 @@
+"""
+Test helper file.
+
+Shared fixture corpora for the in-memory search and docs implementations.
+Records and their meta are wrapped in read-only MappingProxyType views and
+kept in tuples so they are built once per process and cannot be mutated by a
+test; the fixture impls copy meta into every result they hand out.
+"""
+from __future__ import annotations
+
+import sys
+from types import MappingProxyType
+from typing import Any, Dict
+
+# Search: default tiny corpus used for most tests
+_SEARCH_DOCS = (
+    {
+        "id": "doc:media-pipeline",
+        "text": "media playback pipeline overview and troubleshooting",
+        "meta": {"source": "docs"},
+    },
+    {
+        "id": "doc:render-thread",
+        "text": "rendering pipeline stages and frame pacing",
+        "meta": {"source": "docs"},
+    },
+    {"id": "doc:media", "text": "media audio video decoding demuxer", "meta": {"source": "notes"}},
+    {"id": "doc:unrelated", "text": "profiling tips and CLI usage", "meta": {"source": "misc"}},
+)
+
+# Docs: small parent/chunk corpus
+_STORE_DOCS = (
+    {"id": "doc:media", "text": "MEDIA FULL DOC", "meta": {"source": "docs", "title": "Media"}},
+    {
+        "id": "doc:media#0-10",
+        "text": "MEDIA FULL",
+        "meta": {"source": "docs", "title": "Media"},
+        "parent_id": "doc:media",
+    },
+    {
+        "id": "doc:media#10-20",
+        "text": " DOC TEXT",
+        "meta": {"source": "docs", "title": "Media"},
+        "parent_id": "doc:media",
+    },
+    {
+        "id": "doc:render-thread",
+        "text": "RENDER FULL DOC",
+        "meta": {"source": "docs", "title": "Render Thread"},
+    },
+    {
+        "id": "doc:render-thread#0-10",
+        "text": "RENDER FULL",
+        "meta": {"source": "docs", "title": "Render Thread"},
+        "parent_id": "doc:render-thread",
+    },
+)
+
+
+def _intern_str(v: Any) -> Any:
+    return sys.intern(v) if isinstance(v, str) else v
+
+
+def _frozen(doc: Dict[str, Any]) -> MappingProxyType:
+    # Intern ids and meta strings so repeated filter/id lookups can hit the
+    # identity fast path in dict comparisons.
+    rec = {_intern_str(k): _intern_str(v) for k, v in doc.items() if k != "meta"}
+    if "meta" in doc:
+        rec["meta"] = MappingProxyType({sys.intern(k): _intern_str(v) for k, v in doc["meta"].items()})
+    return MappingProxyType(rec)
+
+
+SEARCH_CORPUS = tuple(_frozen(d) for d in _SEARCH_DOCS)
+DOCS_CORPUS = tuple(_frozen(d) for d in _STORE_DOCS)
@@ -6,14 +6,28 @@ Used to simulate get_docs_by_id behavior without a real backend.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 
-def make_fixture_docs(corpus: Optional[List[Dict[str, Any]]] = None):
+def _normalize(d: Mapping[str, Any]) -> Dict[str, Any]:
+    # Ensure shape: id, text, meta
+    return {
+        "id": d["id"],
+        "text": d["text"],
+        "meta": dict(d.get("meta", {})),
+    }
+
+
+def _fresh(rec: Dict[str, Any]) -> Dict[str, Any]:
+    # Hand out a new record per call so callers can't mutate the shared store
+    return {**rec, "meta": dict(rec["meta"])}
+
+
+def make_fixture_docs(corpus: Optional[Sequence[Mapping[str, Any]]] = None):
     data = list(corpus or [])
 
-    parents: Dict[str, Dict[str, Any]] = {}
-    chunks: Dict[str, Dict[str, Any]] = {}
+    parents: Dict[str, Mapping[str, Any]] = {}
+    chunks: Dict[str, Mapping[str, Any]] = {}
     parent_of: Dict[str, str] = {}
 
     for doc in data:
@@ -24,60 +38,51 @@ def make_fixture_docs(corpus: Optional[List[Dict[str, Any]]] = None):
         else:
             parents[doc_id] = doc
 
-    def _parent_id_of(doc_id: str) -> Optional[str]:
-        if doc_id in parent_of:
-            return parent_of[doc_id]
-        if doc_id in parents:
-            return doc_id
-        return None
+    # Normalize every record once; docs_impl hands out fresh copies of these.
+    parents = {k: _normalize(v) for k, v in parents.items()}
+    chunks = {k: _normalize(v) for k, v in chunks.items()}
+
+    # One lookup classifies an id; chunks take precedence, as in the old checks.
+    kind_map: Dict[str, Tuple[str, Dict[str, Any]]] = {
+        pid: ("parent", rec) for pid, rec in parents.items()
+    }
+    kind_map.update((cid, ("chunk", rec)) for cid, rec in chunks.items())
 
     def docs_impl(ids: List[str], return_kind: str) -> List[Dict[str, Any]]:
         results: List[Dict[str, Any]] = []
 
         if return_kind == "chunk":
             for i in ids:
-                if i in chunks:
-                    results.append(_normalize(chunks[i]))
-                elif i in parents:
-                    results.append(_normalize(parents[i]))
+                hit = kind_map.get(i)
+                if hit is not None:
+                    results.append(_fresh(hit[1]))
             return results
 
         if return_kind == "parent":
-            seen: set[str] = set()
-            ordered_parent_ids: List[str] = []
-            for i in ids:
-                pid = _parent_id_of(i)
-                if pid and pid not in seen:
-                    seen.add(pid)
-                    ordered_parent_ids.append(pid)
+            # dict.fromkeys: ordered de-duplication in a single pass
+            ordered_parent_ids = dict.fromkeys(parent_of.get(i, i) for i in ids)
             for pid in ordered_parent_ids:
-                if pid in parents:
-                    # Removed walrus operator for broader Python compatibility
-                    results.append(_normalize(parents[pid]))
+                rec = parents.get(pid)
+                if rec is not None:
+                    results.append(_fresh(rec))
             return results
 
         # return_kind == "both"
         seen_ids: set[str] = set()
         for i in ids:
-            if i in chunks:
-                if i not in seen_ids:
-                    seen_ids.add(i)
-                    results.append(_normalize(chunks[i]))
-                pid = _parent_id_of(i)
-                if pid and pid in parents and pid not in seen_ids:
-                    seen_ids.add(pid)
-                    results.append(_normalize(parents[pid]))
-            elif i in parents and i not in seen_ids:
+            hit = kind_map.get(i)
+            if hit is None:
+                continue
+            kind, rec = hit
+            if i not in seen_ids:
                 seen_ids.add(i)
-                results.append(_normalize(parents[i]))
+                results.append(_fresh(rec))
+            if kind == "chunk":
+                pid = parent_of[i]
+                parent = parents.get(pid)
+                if parent is not None and pid not in seen_ids:
+                    seen_ids.add(pid)
+                    results.append(_fresh(parent))
         return results
 
-    def _normalize(d: Dict[str, Any]) -> Dict[str, Any]:
-        # Ensure shape: id, text, meta
-        return {
-            "id": d["id"],
-            "text": d["text"],
-            "meta": dict(d.get("meta", {})),
-        }
-
     return docs_impl
@@ -0,0 +1,71 @@
+"""
+Test helper file.
+
+Shared, precompiled patterns and file helpers for the knowledge doc structure
+tests (tests/rag/test_basic_class_docs_structure.py and
+tests/rag/test_profiler_playbooks_structure.py). Patterns are compiled once at
+import so both modules reuse the same objects.
+"""
+from __future__ import annotations
+
+import os
+import re
+from operator import attrgetter
+from pathlib import Path
+
+# A top-level '## ' section heading line
+HEADING_H2 = re.compile(r"^##\s+.+", re.M)
+
+# Body of a YAML 'links:' block, up to the next top-level key or fence
+LINKS_BLOCK = re.compile(r"(?s)^links:\n(.*?)(?:\n[A-Za-z_-]+:|^---|\Z)", re.M)
+
+# A bullet line naming at least one backticked identifier
+THREAD_BULLET = re.compile(r"^- .*`[^`]+`", re.M)
+
+# Leftovers from authoring tools that must never ship in knowledge docs
+TOOLING_ARTIFACTS = (b"oaicite", b"contentReference")
+
+
+def read_doc_bytes(path: Path) -> bytes:
+    assert path.exists(), f"Missing {path}"
+    return path.read_bytes()
+
+
+def read_doc(path: Path) -> str:
+    return read_doc_bytes(path).decode("utf-8")
+
+
+def front_matter_keys(text: str) -> frozenset:
+    """
+    Keys (with trailing ':') set in the YAML front matter, found by slicing the
+    block between the first two '---' fences once. A key counts as set when it
+    has an inline value or at least one nested line under it.
+    """
+    keys = set()
+    pending = None
+    for line in text.lstrip().splitlines()[1:]:
+        if line.strip() == "---":
+            break
+        if line[:1] in (" ", "\t", "-"):
+            if pending and line.strip():
+                keys.add(pending)
+                pending = None
+            continue
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        pending = None
+        if value.strip():
+            keys.add(key + ":")
+        else:
+            pending = key + ":"
+    return frozenset(keys)
+
+
+def md_files(root: Path) -> list[Path]:
+    """List *.md files in `root` with one scandir pass (DirEntry caches the file type)."""
+    if not root.is_dir():
+        return []
+    with os.scandir(root) as it:
+        paths = [Path(e.path) for e in it if e.name.endswith(".md") and e.is_file()]
+    return sorted(paths, key=attrgetter("name"))
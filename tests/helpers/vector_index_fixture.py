@@ -7,16 +7,70 @@ relying on a real backend index.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import heapq
+import sys
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+# Maps every non-alphanumeric ASCII character to a space.
+_ASCII_SEPARATORS = {i: " " for i in range(128) if not chr(i).isalnum()}
 
 
 def _tokenize(s: str) -> list[str]:
-    return [t for t in "".join(ch if ch.isalnum() else " " for ch in s.lower()).split() if t]
+    s = s.lower()
+    if s.isascii():
+        return s.translate(_ASCII_SEPARATORS).split()
+    # Non-ASCII text: keep the per-character path so unicode isalnum() still applies
+    return "".join(ch if ch.isalnum() else " " for ch in s).split()
+
+
+def _rank_key(r: Dict[str, Any]):
+    return (-r["score"], r["id"])
+
+
+def _copy_hit(r: Dict[str, Any]) -> Dict[str, Any]:
+    # Copy meta too: it is shared with the corpus and the memo otherwise.
+    return {**r, "meta": dict(r["meta"])}
+
+
+# Built search impls for immutable (tuple) corpora, keyed by id(corpus). The corpus
+# itself is kept alongside so a recycled id can never return a stale impl.
+_SEARCH_IMPLS: Dict[int, Tuple[Any, Any]] = {}
 
 
-def make_fixture_search(corpus: Optional[List[Dict[str, Any]]] = None):
+def make_fixture_search(corpus: Optional[Sequence[Mapping[str, Any]]] = None):
+    if isinstance(corpus, tuple):
+        hit = _SEARCH_IMPLS.get(id(corpus))
+        if hit is not None and hit[0] is corpus:
+            return hit[1]
+        impl = _build_fixture_search(corpus)
+        _SEARCH_IMPLS[id(corpus)] = (corpus, impl)
+        return impl
+    return _build_fixture_search(corpus)
+
+
+def _build_fixture_search(corpus: Optional[Sequence[Mapping[str, Any]]]):
     data = list(corpus or [])
 
+    # Tokenize the corpus once; queries then only do per-token dict lookups.
+    prepared = []
+    for doc in data:
+        text = doc["text"]
+        prepared.append((doc, doc.get("meta", {}), text, Counter(_tokenize(text)), text.lower()))
+
+    # Bucket corpus positions by (meta key, value) so filtered searches only visit matches.
+    by_meta: Dict[Any, List[int]] = defaultdict(list)
+    for pos, (_doc, meta, *_rest) in enumerate(prepared):
+        for key, val in meta.items():
+            try:
+                by_meta[(key, val)].append(pos)
+            except TypeError:
+                continue  # unhashable meta values can't be filtered on anyway
+
+    # The corpus is read-only, so identical searches always give identical results.
+    memo: Dict[Any, List[Dict[str, Any]]] = {}
+
     def search_impl(
         query: str,
         k: int,
@@ -24,33 +78,44 @@ def make_fixture_search(corpus: Optional[List[Dict[str, Any]]] = None):
         section_hard_limit: int,
         reranker: str,  # ignored in fixture
     ) -> List[Dict[str, Any]]:
+        try:
+            memo_key = (query, k, tuple(sorted(filters.items())) if filters else None, section_hard_limit)
+            cached = memo.get(memo_key)
+        except TypeError:
+            # Unhashable filter values (e.g. lists) can't be memoized; search uncached
+            memo_key = cached = None
+        if cached is not None:
+            return [_copy_hit(r) for r in cached]
+
         q_tokens = _tokenize(query)
+        q_uniq = set(q_tokens)
         results: List[Dict[str, Any]] = []
 
-        for doc in data:
-            # Apply simple filters on meta
-            meta = doc.get("meta", {})
-            if filters:
-                ok = True
-                for key, val in filters.items():
-                    if meta.get(key) != val:
-                        ok = False
-                        break
-                if not ok:
-                    continue
-
-            text = doc["text"]
-            t_tokens = _tokenize(text)
-
+        candidates = prepared
+        if filters:
+            # Apply simple filters on meta: intersect the matching buckets
+            positions = None
+            for key, val in filters.items():
+                if isinstance(key, str):
+                    key = sys.intern(key)
+                if isinstance(val, str):
+                    val = sys.intern(val)
+                try:
+                    bucket = by_meta.get((key, val), ())
+                except TypeError:
+                    bucket = ()  # unhashable meta values aren't bucketed either, so nothing matches
+                positions = set(bucket) if positions is None else positions.intersection(bucket)
+                if not positions:
+                    break
+            candidates = [prepared[pos] for pos in sorted(positions or ())]
+
+        for doc, meta, text, t_counts, tlower in candidates:
             # Exact token matches
-            exact = sum(t_tokens.count(qt) for qt in q_tokens)
+            exact = sum(t_counts[qt] for qt in q_tokens)
 
-            # Partial substring matches (query token substring appears in original text)
-            partial = 0
-            tlower = text.lower()
-            for qt in q_tokens:
-                if qt and qt not in t_tokens and qt in tlower:
-                    partial += 1
+            # Partial substring matches (query token substring appears in original text);
+            # each distinct query token counts at most once
+            partial = sum(1 for qt in q_uniq if qt not in t_counts and qt in tlower)
 
             score = exact * 1.0 + partial * 0.1
 
@@ -70,10 +135,16 @@ def make_fixture_search(corpus: Optional[List[Dict[str, Any]]] = None):
                 }
             )
 
-        # Sort: score desc, then id asc for determinism
-        results.sort(key=lambda r: (-r["score"], r["id"]))
-
-        # Top-k
-        return results[: max(0, k)]
+        # Top-k by score desc, then id asc for determinism. A heap only pays
+        # off when k is small relative to the candidate count.
+        k = max(0, k)
+        if 0 < k < len(results) // 2:
+            top = heapq.nsmallest(k, results, key=_rank_key)
+        else:
+            results.sort(key=_rank_key)
+            top = results[:k]
+        if memo_key is not None:
+            memo[memo_key] = [_copy_hit(r) for r in top]
+        return [_copy_hit(r) for r in top]
 
     return search_impl
@@ -1,69 +1,89 @@
-import re
 from pathlib import Path
 
+import pytest
+
+from tests.helpers.knowledge_doc_patterns import (
+    HEADING_H2,
+    LINKS_BLOCK,
+    THREAD_BULLET,
+    TOOLING_ARTIFACTS,
+    front_matter_keys,
+    md_files,
+    read_doc,
+    read_doc_bytes,
+)
+
 ROOT = Path("knowledge/basic/classes")
 EXAMPLE = ROOT / "example_class.md"
 
-def _read(path: Path) -> str:
-    assert path.exists(), f"Missing {path}"
-    return path.read_text(encoding="utf-8")
+REQUIRED_YAML_KEYS = ("id:", "title:", "kind:")
 
 def _extract_section(text: str, heading: str) -> str:
     """
     Extract content of a '## ' section starting at `heading` until the next '## ' or end.
     """
-    pattern = rf"(?s){re.escape(heading)}\n(.*?)(?:\n## |\Z)"
-    m = re.search(pattern, text)
-    return m.group(1) if m else ""
+    i = text.find(heading + "\n")
+    if i < 0:
+        return ""
+    start = i + len(heading) + 1
+    end = text.find("\n## ", start)
+    return text[start:end] if end >= 0 else text[start:]
+
+# Collected once; each class doc becomes its own test case (xdist-friendly).
+_CLASS_DOCS = [p for p in md_files(ROOT) if p.name != EXAMPLE.name]
+
+# The example and the sections it requires are read once, at import. A missing
+# example leaves these empty; test_example_class_template_is_valid reports it.
+_EXAMPLE_TEXT = read_doc(EXAMPLE) if EXAMPLE.exists() else ""
+_REQUIRED_SECTIONS = tuple(h.rstrip() for h in HEADING_H2.findall(_EXAMPLE_TEXT))
 
-def test_all_class_docs_follow_example_structure():
-    # Load the example template and derive required top-level sections
-    example_text = _read(EXAMPLE)
-    required_sections = re.findall(r"^##\s+.+", example_text, flags=re.M)
-    assert required_sections, "No top-level sections found in example_class.md"
+def test_example_class_template_is_valid():
+    assert EXAMPLE.exists(), f"Missing {EXAMPLE}"
+    assert _REQUIRED_SECTIONS, "No top-level sections found in example_class.md"
 
     # The example must define both Profiler subsections
-    assert "## Profiler Markers" in example_text, "Template missing '## Profiler Markers'"
-    assert "### Normal" in example_text, "Template missing '### Normal' under Profiler Markers"
-    assert "### Troubleshooting" in example_text, "Template missing '### Troubleshooting' under Profiler Markers"
-
-    # Check every *.md file in the folder (except the template itself)
-    for path in sorted(ROOT.glob("*.md")):
-        if path.name == EXAMPLE.name:
-            continue
-
-        # Debug log for which file is being checked
-        print(f"[DEBUG] Checking structure of {path.relative_to(ROOT)}")
-
-        text = _read(path)
-
-        # 1) YAML front matter fence
-        assert text.lstrip().startswith("---"), f"{path}: Missing YAML front-matter fence '---'"
-
-        # 2) Minimal required YAML keys
-        for key in ("id:", "title:", "kind:"):
-            assert re.search(rf"^{key}\s*\S", text, flags=re.M), f"{path}: Missing YAML key: {key}"
-
-        # 3) Validate each links entry contains 'type' and 'url'
-        links_block = re.search(r"(?s)^links:\n(.*?)(?:\n[A-Za-z_-]+:|^---|\Z)", text, flags=re.M)
-        if links_block:
-            entries = links_block.group(1)
-            assert "type:" in entries and "url:" in entries, f"{path}: Each link should include 'type' and 'url'"
-
-        # 4) Required top-level sections
-        for heading in required_sections:
-            assert heading in text, f"{path}: Missing section: {heading}"
-
-        # 5) Profiler Markers must have both subsections
-        assert "### Normal" in text, f"{path}: Missing '### Normal' under Profiler Markers"
-        assert "### Troubleshooting" in text, f"{path}: Missing '### Troubleshooting' under Profiler Markers"
-
-        # 6) Threads section must include at least one backticked name
-        threads_body = _extract_section(text, "## Threads")
-        assert threads_body, f"{path}: Couldn't extract Threads section"
-        assert re.search(r"^- .*`[^`]+`", threads_body, flags=re.M), \
-            f"{path}: Threads section should include at least one backticked thread name"
-
-        # 7) No tooling artifacts
-        assert "oaicite" not in text, f"{path}: Contains tooling artifact 'oaicite'"
-        assert "contentReference" not in text, f"{path}: Contains tooling artifact 'contentReference'"
+    assert "## Profiler Markers" in _EXAMPLE_TEXT, "Template missing '## Profiler Markers'"
+    assert "### Normal" in _EXAMPLE_TEXT, "Template missing '### Normal' under Profiler Markers"
+    assert "### Troubleshooting" in _EXAMPLE_TEXT, "Template missing '### Troubleshooting' under Profiler Markers"
+
+@pytest.mark.parametrize("path", _CLASS_DOCS, ids=lambda p: p.name)
+def test_class_doc_follows_example_structure(path):
+    # Debug log for which file is being checked
+    print(f"[DEBUG] Checking structure of {path.relative_to(ROOT)}")
+
+    raw = read_doc_bytes(path)
+
+    # 0) No tooling artifacts (checked on raw bytes, before decoding)
+    for artifact in TOOLING_ARTIFACTS:
+        assert artifact not in raw, f"{path}: Contains tooling artifact {artifact.decode()!r}"
+
+    text = raw.decode("utf-8")
+
+    # 1) YAML front matter fence
+    assert text.lstrip().startswith("---"), f"{path}: Missing YAML front-matter fence '---'"
+
+    # 2) Minimal required YAML keys
+    present = front_matter_keys(text)
+    missing = [k for k in REQUIRED_YAML_KEYS if k not in present]
+    assert not missing, f"{path}: Missing YAML keys: {missing}"
+
+    # 3) Validate each links entry contains 'type' and 'url'
+    links_block = LINKS_BLOCK.search(text)
+    if links_block:
+        entries = links_block.group(1)
+        assert "type:" in entries and "url:" in entries, f"{path}: Each link should include 'type' and 'url'"
+
+    # 4) Required top-level sections: collect the file's H2 lines in one pass
+    found = {m.group(0).rstrip() for m in HEADING_H2.finditer(text)}
+    missing = [h for h in _REQUIRED_SECTIONS if h not in found]
+    assert not missing, f"{path}: Missing sections: {missing}"
+
+    # 5) Profiler Markers must have both subsections
+    assert "### Normal" in text, f"{path}: Missing '### Normal' under Profiler Markers"
+    assert "### Troubleshooting" in text, f"{path}: Missing '### Troubleshooting' under Profiler Markers"
+
+    # 6) Threads section must include at least one backticked name
+    threads_body = _extract_section(text, "## Threads")
+    assert threads_body, f"{path}: Couldn't extract Threads section"
+    assert THREAD_BULLET.search(threads_body), \
+        f"{path}: Threads section should include at least one backticked thread name"
@@ -4,6 +4,8 @@ Behavior tests for context_summarize via the fallback summarizer:
 - citation offsets slice exact IDs
 - styles produce non-empty output when hits exist
 """
+import pytest
+
 from profiler_assistant.rag.types import (
     VectorSearchHit,
     ContextSummarizeRequest,
@@ -31,16 +33,20 @@ def test_truncation_and_offsets_bullet():
         assert res.summary[c.offset[0] : c.offset[1]] == c.id
 
 
-def test_styles_have_output_and_citations():
-    hits = [
+@pytest.fixture(scope="module")
+def two_hits():
+    return [
         _hit("a", "Alpha sentence one. Alpha sentence two."),
         _hit("b", "Beta sentence one. Beta sentence two."),
     ]
-    for style in ("bullet", "abstract", "qa"):
-        res = context_summarize(ContextSummarizeRequest(hits=hits, style=style, token_budget=40))
-        assert isinstance(res.summary, str)
-        assert len(res.summary) > 0
-        assert len(res.citations) >= 1
+
+
+@pytest.mark.parametrize("style", ["bullet", "abstract", "qa"])
+def test_styles_have_output_and_citations(two_hits, style):
+    res = context_summarize(ContextSummarizeRequest(hits=two_hits, style=style, token_budget=40))
+    assert isinstance(res.summary, str)
+    assert len(res.summary) > 0
+    assert len(res.citations) >= 1
 
 
 def test_no_hits_returns_empty():
@@ -21,6 +21,14 @@ def test_both_mode_orders_chunk_then_parent_and_dedups():
     assert ids == ["doc:media#0-10", "doc:media"]
 
 
+def test_mutating_returned_meta_does_not_leak_into_store():
+    first = get_docs_by_id(GetDocsByIdRequest(ids=["doc:media"], return_="parent"))
+    first.docs[0].meta["title"] = "CHANGED"
+
+    again = get_docs_by_id(GetDocsByIdRequest(ids=["doc:media#0-10"], return_="both"))
+    assert [d.meta.get("title") for d in again.docs] == ["Media", "Media"]
+
+
 def test_chunk_mode_accepts_parent_ids():
     req = GetDocsByIdRequest(ids=["doc:render-thread"], return_="chunk")
     resp = get_docs_by_id(req)
@@ -3,9 +3,10 @@ Validate that the index manifest is written and that retrieval fast-fails when
 the query embedder/index settings don't match the corpus.
 """
 
+import hashlib
 import json
-import os
 import tempfile
+from pathlib import Path
 import numpy as np
 import pytest
 
@@ -17,29 +18,52 @@ from profiler_assistant.rag.manifest import (
 )
 
 def _mk_vectors(n=3, d=8):
-    rng = np.random.default_rng(0)
-    return rng.standard_normal((n, d)).astype(np.float32)
+    # Draw float32 directly; avoids a float64 buffer plus a downcast copy
+    return np.random.default_rng(0).standard_normal((n, d), dtype=np.float32)
+
+@pytest.fixture(scope="session")
+def baseline_vectors(tmp_path_factory):
+    """
+    Save the test vectors once per session. Returns (path, num_vectors, sha256);
+    the digest is computed once here so tests compare against it directly.
+    """
+    path = tmp_path_factory.mktemp("vectors") / "vectors.npy"
+    vecs = _mk_vectors()
+    np.save(path, vecs)
+    return path, vecs.shape[0], hashlib.sha256(path.read_bytes()).hexdigest()
+
+@pytest.fixture(scope="session")
+def baseline_index(tmp_path_factory, baseline_vectors):
+    """An index dir with a manifest for the 'dummy' 8-d normalized embedder."""
+    vectors_path, num_vectors, _ = baseline_vectors
+    idx_dir = tmp_path_factory.mktemp("baseline") / ".fpa_index"
 
-def test_manifest_written_with_expected_fields(tmp_path):
+    write_index_manifest(
+        str(idx_dir),
+        embedder=EmbedderInfo(name="dummy", dim=8, normalize=True),
+        index_impl="numpy",
+        distance="cosine",
+        num_vectors=num_vectors,
+        vectors_path=str(vectors_path),
+    )
+    return idx_dir
+
+def test_manifest_written_with_expected_fields(tmp_path, baseline_vectors):
+    vectors_path, num_vectors, vectors_sha256 = baseline_vectors
     idx_dir = tmp_path / ".fpa_index"
-    vecs = _mk_vectors()
-    vectors_path = idx_dir / "vectors.npy"
-    os.makedirs(idx_dir, exist_ok=True)
-    np.save(vectors_path, vecs)
 
     manifest_path = write_index_manifest(
         str(idx_dir),
         embedder=EmbedderInfo(name="dummy", dim=8, normalize=True),
         index_impl="numpy",
         distance="cosine",
-        num_vectors=vecs.shape[0],
+        num_vectors=num_vectors,
         vectors_path=str(vectors_path),
         lib_versions={"numpy": np.__version__},
         fpa_version=None,
     )
 
-    with open(manifest_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = json.loads(Path(manifest_path).read_bytes())
 
     # Spot-check critical contract fields
     assert data["schema_version"] == 1
@@ -48,81 +72,31 @@ def test_manifest_written_with_expected_fields(tmp_path):
     assert data["normalize"] is True
     assert data["distance"] == "cosine"
     assert data["index_impl"] == "numpy"
-    assert data["num_vectors"] == vecs.shape[0]
-    assert isinstance(data.get("vectors_sha256"), (str, type(None)))
-
-def test_refuse_on_model_name_mismatch(tmp_path):
-    idx_dir = tmp_path / ".fpa_index"
-    os.makedirs(idx_dir, exist_ok=True)
-    np.save(idx_dir / "vectors.npy", _mk_vectors())
-
-    write_index_manifest(
-        str(idx_dir),
-        embedder=EmbedderInfo(name="dummy", dim=8, normalize=True),
-        index_impl="numpy",
-        distance="cosine",
-        num_vectors=3,
-        vectors_path=str(idx_dir / "vectors.npy"),
-    )
-
-    with pytest.raises(IndexCompatibilityError) as ei:
-        assert_index_compatible(
-            str(idx_dir),
-            current_embedder=EmbedderInfo(name="sentence-transformers/all-MiniLM-L6-v2", dim=384, normalize=True),
-            expected_distance="cosine",
-            expected_index_impl="numpy",
-        )
-    assert "embedder_name" in str(ei.value)
-
-def test_refuse_on_dimension_mismatch(tmp_path):
-    idx_dir = tmp_path / ".fpa_index"
-    os.makedirs(idx_dir, exist_ok=True)
-    np.save(idx_dir / "vectors.npy", _mk_vectors())
-
-    write_index_manifest(
-        str(idx_dir),
-        embedder=EmbedderInfo(name="dummy", dim=8, normalize=True),
-        index_impl="numpy",
-        distance="cosine",
-        num_vectors=3,
-        vectors_path=str(idx_dir / "vectors.npy"),
-    )
-
-    with pytest.raises(IndexCompatibilityError) as ei:
-        assert_index_compatible(
-            str(idx_dir),
-            current_embedder=EmbedderInfo(name="dummy", dim=16, normalize=True),
-            expected_distance="cosine",
-            expected_index_impl="numpy",
-        )
-    assert "embedder_dim" in str(ei.value)
-
-def test_refuse_on_normalize_flag_mismatch(tmp_path):
-    idx_dir = tmp_path / ".fpa_index"
-    os.makedirs(idx_dir, exist_ok=True)
-    np.save(idx_dir / "vectors.npy", _mk_vectors())
-
-    write_index_manifest(
-        str(idx_dir),
-        embedder=EmbedderInfo(name="dummy", dim=8, normalize=True),
-        index_impl="numpy",
-        distance="cosine",
-        num_vectors=3,
-        vectors_path=str(idx_dir / "vectors.npy"),
-    )
-
+    assert data["num_vectors"] == num_vectors
+    assert data["vectors_sha256"] == vectors_sha256
+
+@pytest.mark.parametrize(
+    "current_embedder, expected_field",
+    [
+        (EmbedderInfo(name="sentence-transformers/all-MiniLM-L6-v2", dim=8, normalize=True), "embedder_name"),
+        (EmbedderInfo(name="dummy", dim=16, normalize=True), "embedder_dim"),
+        (EmbedderInfo(name="dummy", dim=8, normalize=False), "normalize"),
+    ],
+    ids=["model_name", "dimension", "normalize_flag"],
+)
+def test_refuse_on_embedder_mismatch(baseline_index, current_embedder, expected_field):
     with pytest.raises(IndexCompatibilityError) as ei:
         assert_index_compatible(
-            str(idx_dir),
-            current_embedder=EmbedderInfo(name="dummy", dim=8, normalize=False),
+            str(baseline_index),
+            current_embedder=current_embedder,
             expected_distance="cosine",
             expected_index_impl="numpy",
         )
-    assert "normalize" in str(ei.value)
+    assert expected_field in str(ei.value)
 
 def test_missing_manifest_refuses_with_hint(tmp_path):
     idx_dir = tmp_path / ".fpa_index"
-    os.makedirs(idx_dir, exist_ok=True)
+    idx_dir.mkdir(parents=True, exist_ok=True)
     np.save(idx_dir / "vectors.npy", _mk_vectors())
 
     with pytest.raises(IndexCompatibilityError) as ei:
@@ -7,6 +7,8 @@ Verifies the LLM adapter path for context_summarize without calling a real LLM.
 - No external services or SDKs are used; this test is deterministic.
 """
 
+import pytest
+
 from profiler_assistant.rag.runtime import (
     register_summarizer_impl,
     clear_summarizer_impl,
@@ -22,26 +24,27 @@ def fake_call_llm(messages, max_tokens):
     return "one [[CITE:h1]] two [[CITE:h2]]"
 
 
-def test_llm_adapter_path():
-    try:
-        # Register the LLM-backed summarizer
-        register_summarizer_impl(make_llm_summarizer(fake_call_llm))
-
-        hits = [
-            VectorSearchHit(id="h1", text="t1", score=1.0, meta={"source": "s"}),
-            VectorSearchHit(id="h2", text="t2", score=1.0, meta={"source": "s"}),
-        ]
-        res = context_summarize(
-            ContextSummarizeRequest(hits=hits, style="bullet", token_budget=16)
-        )
-
-        # Summary should include citations converted to (id)
-        assert "(h1)" in res.summary and "(h2)" in res.summary
-
-        # Each citation offset should slice the exact ID substring
-        for c in res.citations:
-            start, end = c.offset
-            assert res.summary[start:end] == c.id
-    finally:
-        # Clean up registry for other tests
-        clear_summarizer_impl()
+@pytest.fixture
+def llm_summarizer():
+    # Register the LLM-backed summarizer; clean up the registry for other tests
+    register_summarizer_impl(make_llm_summarizer(fake_call_llm))
+    yield
+    clear_summarizer_impl()
+
+
+def test_llm_adapter_path(llm_summarizer):
+    hits = [
+        VectorSearchHit(id="h1", text="t1", score=1.0, meta={"source": "s"}),
+        VectorSearchHit(id="h2", text="t2", score=1.0, meta={"source": "s"}),
+    ]
+    res = context_summarize(
+        ContextSummarizeRequest(hits=hits, style="bullet", token_budget=16)
+    )
+
+    # Summary should include citations converted to (id)
+    assert "(h1)" in res.summary and "(h2)" in res.summary
+
+    # Each citation offset should slice the exact ID substring
+    for c in res.citations:
+        start, end = c.offset
+        assert res.summary[start:end] == c.id
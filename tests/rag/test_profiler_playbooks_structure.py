@@ -1,52 +1,71 @@
-import re
 from pathlib import Path
 
+import pytest
+
+from tests.helpers.knowledge_doc_patterns import (
+    TOOLING_ARTIFACTS,
+    front_matter_keys,
+    md_files,
+    read_doc,
+    read_doc_bytes,
+)
+
 ROOT = Path("knowledge/raw/profiler")
 TEMPLATE = ROOT / "example_profiler_playbook.md"
 
 REQUIRED_YAML_KEYS = ("id:", "title:", "source:", "product_area:", "tags:", "updated_at:")
 
-def _read(path: Path) -> str:
-    assert path.exists(), f"Missing {path}"
-    return path.read_text(encoding="utf-8")
+EXPECTED_HEADINGS = (
+    "# Summary",
+    "## Signals & Evidence",
+    "## Analysis & Reasoning",
+    "## Conclusion",
+    "## References",
+)
+
+def _heading_lines(text: str) -> frozenset:
+    """All Markdown heading lines in `text` (trailing whitespace stripped), in one pass."""
+    return frozenset(line.rstrip() for line in text.splitlines() if line.startswith("#"))
+
+# Collected once; each playbook becomes its own test case (xdist-friendly).
+_PLAYBOOKS = [p for p in md_files(ROOT) if p.name != TEMPLATE.name]
+
+# Read once, at import; a missing template is reported by the template test.
+_TEMPLATE_TEXT = read_doc(TEMPLATE) if TEMPLATE.exists() else ""
 
-def test_profiler_playbooks_match_template():
-    # Load the template
-    template_text = _read(TEMPLATE)
+def test_profiler_playbook_template_is_valid():
+    assert TEMPLATE.exists(), f"Missing {TEMPLATE}"
+    template_text = _TEMPLATE_TEXT
 
     # Validate template has required YAML keys
     assert template_text.lstrip().startswith("---"), "Template missing YAML front-matter"
-    for key in REQUIRED_YAML_KEYS:
-        assert re.search(rf"^{key}\s*\S", template_text, flags=re.M), f"Template missing YAML key: {key}"
+    present = front_matter_keys(template_text)
+    missing = [k for k in REQUIRED_YAML_KEYS if k not in present]
+    assert not missing, f"Template missing YAML keys: {missing}"
 
     # Validate template headings
-    expected_headings = [
-        "# Summary",
-        "## Signals & Evidence",
-        "## Analysis & Reasoning",
-        "## Conclusion",
-        "## References",
-    ]
-    for heading in expected_headings:
-        assert re.search(rf"^{re.escape(heading)}\s*$", template_text, flags=re.M), f"Template missing '{heading}'"
-
-    # Check all other files
-    for path in sorted(ROOT.glob("*.md")):
-        if path.name == TEMPLATE.name:
-            continue
-
-        print(f"[DEBUG] Checking profiler playbook structure: {path.relative_to(ROOT)}")
-        text = _read(path)
-
-        # YAML keys
-        assert text.lstrip().startswith("---"), f"{path}: Missing YAML front-matter"
-        for key in REQUIRED_YAML_KEYS:
-            assert re.search(rf"^{key}\s*\S", text, flags=re.M), f"{path}: Missing YAML key: {key}"
-
-        # Headings
-        for heading in expected_headings:
-            assert re.search(rf"^{re.escape(heading)}\s*$", text, flags=re.M), f"{path}: Missing '{heading}'"
-
-        # No tooling artifacts
-        assert "oaicite" not in text, f"{path}: Contains tooling artifact 'oaicite'"
-        assert "contentReference" not in text, f"{path}: Contains tooling artifact 'contentReference'"
+    headings = _heading_lines(template_text)
+    missing = [h for h in EXPECTED_HEADINGS if h not in headings]
+    assert not missing, f"Template missing headings: {missing}"
+
+@pytest.mark.parametrize("path", _PLAYBOOKS, ids=lambda p: p.name)
+def test_profiler_playbook_matches_template(path):
+    print(f"[DEBUG] Checking profiler playbook structure: {path.relative_to(ROOT)}")
+    raw = read_doc_bytes(path)
+
+    # No tooling artifacts (checked on raw bytes, before decoding)
+    for artifact in TOOLING_ARTIFACTS:
+        assert artifact not in raw, f"{path}: Contains tooling artifact {artifact.decode()!r}"
+
+    text = raw.decode("utf-8")
+
+    # YAML keys
+    assert text.lstrip().startswith("---"), f"{path}: Missing YAML front-matter"
+    present = front_matter_keys(text)
+    missing = [k for k in REQUIRED_YAML_KEYS if k not in present]
+    assert not missing, f"{path}: Missing YAML keys: {missing}"
+
+    # Headings
+    headings = _heading_lines(text)
+    missing = [h for h in EXPECTED_HEADINGS if h not in headings]
+    assert not missing, f"{path}: Missing headings: {missing}"
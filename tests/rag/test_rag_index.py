@@ -18,10 +18,12 @@ if _HAS_FAISS:
     from profiler_assistant.rag.index import FaissIndex
 
 
-def _toy_data():
+@pytest.fixture(scope="module")
+def toy_data():
     rng = np.random.RandomState(0)
     base = rng.normal(size=(5, 16)).astype(np.float32)
     base /= np.linalg.norm(base, axis=1, keepdims=True) + 1e-12
+    base.setflags(write=False)  # shared across tests; indexes must not mutate it
     metas = [{
         "doc_id": f"d{i}", "chunk_id": i, "section_path": "A/B", "heading": f"H{i}"
     } for i in range(5)]
@@ -33,8 +35,8 @@ def _assert_hit_schema(hit):
         assert k in hit
 
 
-def test_numpy_index_roundtrip_top1():
-    vecs, metas = _toy_data()
+def test_numpy_index_roundtrip_top1(toy_data):
+    vecs, metas = toy_data
     idx = NumpyIndex(dim=16)
     idx.add(vecs, metas)
     q = vecs[2]  # exact item in the set → should be rank 1
@@ -45,11 +47,11 @@ def test_numpy_index_roundtrip_top1():
     assert -1.01 <= hits[0]["score"] <= 1.01  # cosine range guard
 
 
-def test_backends_identical_results_when_same_vectors():
+def test_backends_identical_results_when_same_vectors(toy_data):
     if not _HAS_FAISS:
         pytest.skip("faiss not installed")
 
-    vecs, metas = _toy_data()
+    vecs, metas = toy_data
     numpy_idx = NumpyIndex(dim=16)
     numpy_idx.add(vecs, metas)
     q = vecs[1]
@@ -58,4 +60,4 @@ def test_backends_identical_results_when_same_vectors():
     faiss_idx = FaissIndex(dim=16)
     faiss_idx.add(vecs, metas)
     faiss_hits = faiss_idx.search(q, k=3)
-    assert [h["doc_id"] for h in faiss_hits] == [h["doc_id"] for h in numpy_hits]
+    assert tuple(h["doc_id"] for h in faiss_hits) == tuple(h["doc_id"] for h in numpy_hits)
@@ -3,6 +3,7 @@ Contract tests updated for vector_search/get_docs_by_id and context_summarize.
 Checks basic shape and citation offsets without relying on any external LLM.
 """
 from dataclasses import asdict
+from itertools import islice
 
 from profiler_assistant.rag.types import (
     Metadata,
@@ -26,8 +27,27 @@ def test_vector_search_success_and_shape():
     resp = vector_search(req)
     assert isinstance(resp.hits, list)
     assert len(resp.hits) >= 2
-    top_ids = [h.id for h in resp.hits[:2]]
-    assert top_ids == ["doc:media-pipeline", "doc:media"]  # tie-breaker by ID
+    top_ids = tuple(h.id for h in islice(resp.hits, 2))
+    assert top_ids == ("doc:media-pipeline", "doc:media")  # tie-breaker by ID
+
+
+def test_vector_search_unhashable_filter_returns_no_hits():
+    req = VectorSearchRequest(query="media pipeline", k=3, filters={"source": ["docs"]})
+    assert vector_search(req).hits == []
+
+
+def test_vector_search_non_string_filter_key_returns_no_hits():
+    req = VectorSearchRequest(query="media pipeline", k=3, filters={1: "docs"})
+    assert vector_search(req).hits == []
+
+
+def test_vector_search_hit_meta_is_not_shared():
+    req = VectorSearchRequest(query="media pipeline", k=3)
+    first = vector_search(req)
+    first.hits[0].meta["source"] = "CHANGED"
+
+    again = vector_search(req)
+    assert again.hits[0].meta["source"] == "docs"
 
 
 def test_vector_search_invalid_args():
@@ -1,10 +1,10 @@
 # tests/test_analysis_tools.py
 
+import numpy as np
 import pandas as pd
 import pytest
-import json
 from pathlib import Path
-from profiler_assistant.parsing import Profile, load_and_parse_profile
+from profiler_assistant.parsing import Profile, parse_profile_dict
 from profiler_assistant.analysis_tools import (
     find_stutter_markers,
     find_media_playback_content_processes,
@@ -19,302 +19,308 @@ from profiler_assistant.analysis_tools import (
     get_cpu_usage_for_thread,
 )
 
-@pytest.fixture
-def stutter_profile_file(tmp_path):
-    """Creates a temporary profile.json file that contains stutter markers."""
-    profile_data = {
-        "meta": {},
-        "stringTable": ["OtherMarker", "Jank", "VideoFallingBehind"],
-        "threads": [
-            {
-                "name": "Compositor",
-                "pid": 1,
-                "tid": 11,
-                "processName": "GPU",
-                "markers": {
-                    "name": [0, 1],  # OtherMarker, Jank
-                    "startTime": [150.0, 250.5],
-                    "endTime": [150.5, 251.0],
-                    "phase": [0, 0],
-                    "category": [1, 1],
-                    "data": [{}, {}]
-                }
-            },
-            {
-                "name": "MediaDecoder",
-                "pid": 1,
-                "tid": 12,
-                "processName": "GPU",
-                "markers": {
-                    "name": [2, 2],  # VideoFallingBehind
-                    "startTime": [300.1, 450.8],
-                    "endTime": [300.2, 451.0],
-                    "phase": [0, 0],
-                    "category": [1, 1],
-                    "data": [{}, {}]
-                }
-            },
-            {
-                "name": "GeckoMain",
-                "pid": 2,
-                "tid": 13,
-                "processName": "WEB",
-                "markers": {
-                    "name": [0],  # OtherMarker
-                    "startTime": [100.0],
-                    "endTime": [101.0],
-                    "phase": [0],
-                    "category": [1],
-                    "data": [{}]
-                }
+STUTTER_PROFILE_DATA = {
+    "meta": {},
+    "stringTable": ["OtherMarker", "Jank", "VideoFallingBehind"],
+    "threads": [
+        {
+            "name": "Compositor",
+            "pid": 1,
+            "tid": 11,
+            "processName": "GPU",
+            "markers": {
+                "name": [0, 1],  # OtherMarker, Jank
+                "startTime": [150.0, 250.5],
+                "endTime": [150.5, 251.0],
+                "phase": [0, 0],
+                "category": [1, 1],
+                "data": [{}, {}]
             }
-        ]
-    }
-    file_path = tmp_path / "stutter_profile.json"
-    file_path.write_text(json.dumps(profile_data))
-    return file_path
+        },
+        {
+            "name": "MediaDecoder",
+            "pid": 1,
+            "tid": 12,
+            "processName": "GPU",
+            "markers": {
+                "name": [2, 2],  # VideoFallingBehind
+                "startTime": [300.1, 450.8],
+                "endTime": [300.2, 451.0],
+                "phase": [0, 0],
+                "category": [1, 1],
+                "data": [{}, {}]
+            }
+        },
+        {
+            "name": "GeckoMain",
+            "pid": 2,
+            "tid": 13,
+            "processName": "WEB",
+            "markers": {
+                "name": [0],  # OtherMarker
+                "startTime": [100.0],
+                "endTime": [101.0],
+                "phase": [0],
+                "category": [1],
+                "data": [{}]
+            }
+        }
+    ]
+}
+
+
+class _MockProfile(Profile):
+    """Profile built directly from prepared processes, skipping JSON parsing."""
+
+    def __init__(self, processes, string_table=None):
+        self.processes = processes
+        self.string_table = string_table
 
-def test_find_stutter_markers(stutter_profile_file):
+
+@pytest.fixture(scope="session")
+def parsed_stutter_profile():
+    """Parses the stutter profile once; tests must not mutate it."""
+    return parse_profile_dict(STUTTER_PROFILE_DATA)
+
+
+def test_find_stutter_markers(parsed_stutter_profile):
     """
     Tests that the find_stutter_markers function correctly identifies
     and extracts Jank and VideoFallingBehind markers.
     """
-    profile = load_and_parse_profile(str(stutter_profile_file))
+    profile = parsed_stutter_profile
     stutter_events = find_stutter_markers(profile)
 
     assert not stutter_events.empty
     assert len(stutter_events) == 3
 
+    marker_names = set(stutter_events['markerName'].tolist())
+    thread_names = set(stutter_events['threadName'].tolist())
+    times = set(stutter_events['time'].tolist())
+
     # Check that the correct marker names were found
-    assert "Jank" in stutter_events['markerName'].values
-    assert "VideoFallingBehind" in stutter_events['markerName'].values
+    assert "Jank" in marker_names
+    assert "VideoFallingBehind" in marker_names
 
     # Check that the thread names are correct
-    assert "Compositor" in stutter_events['threadName'].values
-    assert "MediaDecoder" in stutter_events['threadName'].values
+    assert "Compositor" in thread_names
+    assert "MediaDecoder" in thread_names
 
     # Check that the times are correct
-    assert 250.5 in stutter_events['time'].values
-    assert 300.1 in stutter_events['time'].values
-    assert 450.8 in stutter_events['time'].values
+    assert 250.5 in times
+    assert 300.1 in times
+    assert 450.8 in times
 
 def test_find_media_playback_content_processes():
-    class MockProfile(Profile):
-        def __init__(self):
-            self.processes = {
-                "0": {
-                    "process_name": "Isolated Web Content",
-                    "pid": 100,
-                    "threads": [
-                        {"name": "MediaDecoderStateMachine", "markers": ["marker1"]},
-                        {"name": "OtherThread", "markers": []},
-                    ]
-                },
-                "1": {
-                    "process_name": "Isolated Web Content",
-                    "pid": 101,
-                    "threads": [
-                        {"name": "MediaDecoderStateMachine", "markers": []}
-                    ]
-                },
-                "2": {
-                    "process_name": "Web Content",
-                    "pid": 102,
-                    "threads": [
-                        {"name": "MediaDecoderStateMachine", "markers": ["marker2"]}
-                    ]
-                },
-            }
+    processes = {
+        "0": {
+            "process_name": "Isolated Web Content",
+            "pid": 100,
+            "threads": [
+                {"name": "MediaDecoderStateMachine", "markers": ["marker1"]},
+                {"name": "OtherThread", "markers": []},
+            ]
+        },
+        "1": {
+            "process_name": "Isolated Web Content",
+            "pid": 101,
+            "threads": [
+                {"name": "MediaDecoderStateMachine", "markers": []}
+            ]
+        },
+        "2": {
+            "process_name": "Web Content",
+            "pid": 102,
+            "threads": [
+                {"name": "MediaDecoderStateMachine", "markers": ["marker2"]}
+            ]
+        },
+    }
 
-    profile = MockProfile()
+    profile = _MockProfile(processes)
     result = find_media_playback_content_processes(profile)
 
     assert len(result) == 1
     assert result.iloc[0]["pid"] == 100
 
 def test_find_rendering_process():
-    class MockProfile(Profile):
-        def __init__(self):
-            self.processes = {
-                "a": {
-                    "process_name": "Web Content",
-                    "pid": 200,
-                    "threads": [
-                        {"name": "Renderer", "markers": ["draw"]},
-                        {"name": "Compositor", "markers": ["composite"]},
-                    ]
-                },
-                "b": {
-                    "process_name": "Web Content",
-                    "pid": 201,
-                    "threads": [
-                        {"name": "Renderer", "markers": ["draw"]},
-                    ]
-                },
-                "c": {
-                    "process_name": "Web Content",
-                    "pid": 202,
-                    "threads": [
-                        {"name": "Compositor", "markers": ["composite"]},
-                    ]
-                },
-            }
+    processes = {
+        "a": {
+            "process_name": "Web Content",
+            "pid": 200,
+            "threads": [
+                {"name": "Renderer", "markers": ["draw"]},
+                {"name": "Compositor", "markers": ["composite"]},
+            ]
+        },
+        "b": {
+            "process_name": "Web Content",
+            "pid": 201,
+            "threads": [
+                {"name": "Renderer", "markers": ["draw"]},
+            ]
+        },
+        "c": {
+            "process_name": "Web Content",
+            "pid": 202,
+            "threads": [
+                {"name": "Compositor", "markers": ["composite"]},
+            ]
+        },
+    }
 
-    profile = MockProfile()
+    profile = _MockProfile(processes)
     result = find_rendering_process(profile)
 
-    assert isinstance(result, pd.Series)
     assert result["pid"] == 200
 
 def test_find_rendering_process_no_match():
-    class MockProfile(Profile):
-        def __init__(self):
-            self.processes = {
-                "x": {
-                    "process_name": "Web Content",
-                    "pid": 301,
-                    "threads": [
-                        {"name": "Renderer", "markers": ["draw"]},
-                    ]
-                },
-                "y": {
-                    "process_name": "Web Content",
-                    "pid": 302,
-                    "threads": [
-                        {"name": "Compositor", "markers": ["composite"]},
-                    ]
-                },
-            }
+    processes = {
+        "x": {
+            "process_name": "Web Content",
+            "pid": 301,
+            "threads": [
+                {"name": "Renderer", "markers": ["draw"]},
+            ]
+        },
+        "y": {
+            "process_name": "Web Content",
+            "pid": 302,
+            "threads": [
+                {"name": "Compositor", "markers": ["composite"]},
+            ]
+        },
+    }
 
-    profile = MockProfile()
+    profile = _MockProfile(processes)
     with pytest.raises(ValueError, match="No rendering process found"):
         find_rendering_process(profile)
 
+# Marker frames are built once at import. The tools under test either read
+# them or deepcopy the profile first, so sharing them between tests is safe.
+_EMPTY_MARKERS = pd.DataFrame()
+
+
+def _markers(names, start_times):
+    """Marker frame with the int64/float64 columns the parser would produce."""
+    return pd.DataFrame(
+        {
+            "name": np.asarray(names, dtype=np.int64),
+            "startTime": np.asarray(start_times, dtype=np.float64),
+        },
+        copy=False,
+    )
+
+
+_IWC_DECODER_MARKERS = _markers([0, 1, 0], [10.5, 20.0, 30.25])
+_WEB_DECODER_MARKERS = _markers([0], [100.0])
+_DECODER_MARKERS = _markers([0, 1], [123.0, 456.0])
+_COMPOSITOR_MARKERS = _markers([1], [789.0])
+_CROP_MARKERS = _markers([0, 1, 0], [100.0, 150.0, 300.0])
+
+
 def test_find_video_sink_dropped_frames():
-    class MockProfile(Profile):
-        def __init__(self):
-            self.string_table = {
-                0: "VideoSinkDroppedFrame",
-                1: "OtherMarker"
-            }
-            self.processes = {
-                "1": {
+    string_table = {
+        0: "VideoSinkDroppedFrame",
+        1: "OtherMarker"
+    }
+    processes = {
+        "1": {
+            "process_name": "Isolated Web Content",
+            "pid": 10,
+            "threads": [
+                {
+                    "name": "MediaDecoderStateMachine",
                     "process_name": "Isolated Web Content",
-                    "pid": 10,
-                    "threads": [
-                        {
-                            "name": "MediaDecoderStateMachine",
-                            "process_name": "Isolated Web Content",
-                            "markers": pd.DataFrame({
-                                "name": [0, 1, 0],
-                                "startTime": [10.5, 20.0, 30.25]
-                            })
-                        },
-                        {
-                            "name": "OtherThread",
-                            "process_name": "Isolated Web Content",
-                            "markers": pd.DataFrame()
-                        }
-                    ]
+                    "markers": _IWC_DECODER_MARKERS
                 },
-                "2": {
+                {
+                    "name": "OtherThread",
+                    "process_name": "Isolated Web Content",
+                    "markers": _EMPTY_MARKERS
+                }
+            ]
+        },
+        "2": {
+            "process_name": "Web Content",
+            "pid": 20,
+            "threads": [
+                {
+                    "name": "MediaDecoderStateMachine",
                     "process_name": "Web Content",
-                    "pid": 20,
-                    "threads": [
-                        {
-                            "name": "MediaDecoderStateMachine",
-                            "process_name": "Web Content",
-                            "markers": pd.DataFrame({
-                                "name": [0],
-                                "startTime": [100.0]
-                            })
-                        }
-                    ]
+                    "markers": _WEB_DECODER_MARKERS
                 }
-            }
+            ]
+        }
+    }
 
-    profile = MockProfile()
+    profile = _MockProfile(processes, string_table=string_table)
     result = find_video_sink_dropped_frames(profile)
 
-    assert isinstance(result, pd.DataFrame)
     assert len(result) == 2
     assert all(result["markerName"] == "VideoSinkDroppedFrame")
     assert all(result["threadName"] == "MediaDecoderStateMachine")
     assert all(result["processName"] == "Isolated Web Content")
-    assert set(result["time"]) == {10.5, 30.25}
+    assert set(result["time"].unique()) == {10.5, 30.25}
 
 def test_extract_markers_from_threads():
-    class MockProfile(Profile):
-        def __init__(self):
-            self.string_table = {
-                0: "MarkerA",
-                1: "MarkerB"
-            }
-            self.processes = {
-                "a": {
+    string_table = {
+        0: "MarkerA",
+        1: "MarkerB"
+    }
+    processes = {
+        "a": {
+            "process_name": "Web Content",
+            "threads": [
+                {
+                    "name": "Decoder",
                     "process_name": "Web Content",
-                    "threads": [
-                        {
-                            "name": "Decoder",
-                            "process_name": "Web Content",
-                            "markers": pd.DataFrame({
-                                "name": [0, 1],
-                                "startTime": [123.0, 456.0]
-                            })
-                        },
-                        {
-                            "name": "Compositor",
-                            "process_name": "Web Content",
-                            "markers": pd.DataFrame({
-                                "name": [1],
-                                "startTime": [789.0]
-                            })
-                        }
-                    ]
+                    "markers": _DECODER_MARKERS
                 },
-                "b": {
+                {
+                    "name": "Compositor",
+                    "process_name": "Web Content",
+                    "markers": _COMPOSITOR_MARKERS
+                }
+            ]
+        },
+        "b": {
+            "process_name": "GPU",
+            "threads": [
+                {
+                    "name": "Renderer",
                     "process_name": "GPU",
-                    "threads": [
-                        {
-                            "name": "Renderer",
-                            "process_name": "GPU",
-                            "markers": pd.DataFrame()
-                        }
-                    ]
+                    "markers": _EMPTY_MARKERS
                 }
-            }
+            ]
+        }
+    }
 
-    profile = MockProfile()
+    profile = _MockProfile(processes, string_table=string_table)
     result = extract_markers_from_threads(profile, ["Decoder", "Compositor"])
 
-    assert isinstance(result, pd.DataFrame)
     assert len(result) == 3
-    assert set(result["markerName"]) == {"MarkerA", "MarkerB"}
-    assert set(result["threadName"]) == {"Decoder", "Compositor"}
-    assert set(result["processName"]) == {"Web Content"}
-    assert set(result["time"]) == {123.0, 456.0, 789.0}
+    assert set(result["markerName"].unique()) == {"MarkerA", "MarkerB"}
+    assert set(result["threadName"].unique()) == {"Decoder", "Compositor"}
+    assert set(result["processName"].unique()) == {"Web Content"}
+    assert set(result["time"].unique()) == {123.0, 456.0, 789.0}
 
 def test_crop_profile_by_time():
-    class MockProfile(Profile):
-        def __init__(self):
-            self.string_table = {0: "MarkerA", 1: "MarkerB"}
-            self.processes = {
-                1: {
-                    "name": "Web Content",
-                    "threads": [
-                        {
-                            "name": "Compositor",
-                            "process_name": "Web Content",
-                            "markers": pd.DataFrame({
-                                "name": [0, 1, 0],
-                                "startTime": [100.0, 150.0, 300.0]
-                            })
-                        }
-                    ]
+    string_table = {0: "MarkerA", 1: "MarkerB"}
+    processes = {
+        1: {
+            "name": "Web Content",
+            "threads": [
+                {
+                    "name": "Compositor",
+                    "process_name": "Web Content",
+                    "markers": _CROP_MARKERS
                 }
-            }
+            ]
+        }
+    }
 
-    profile = MockProfile()
+    profile = _MockProfile(processes, string_table=string_table)
     cropped = crop_profile_by_time(profile, start=120.0, end=200.0)
 
     thread = cropped.processes[1]["threads"][0]
@@ -325,48 +331,41 @@ def test_crop_profile_by_time():
     assert profile.processes[1]["threads"][0]["markers"].shape[0] == 3  # original untouched
 
 def test_extract_markers_by_name():
-    class MockProfile(Profile):
-        def __init__(self):
-            self.string_table = {0: "MarkerA", 1: "MarkerB", 2: "Other"}
-            self.processes = {
-                1: {
-                    "name": "Content",
-                    "threads": [
-                        {
-                            "name": "Decoder",
-                            "process_name": "Content",
-                            "markers": pd.DataFrame({
-                                "name": [0, 2, 1],
-                                "startTime": [10.0, 20.0, 30.0]
-                            })
-                        }
-                    ]
+    string_table = {0: "MarkerA", 1: "MarkerB", 2: "Other"}
+    processes = {
+        1: {
+            "name": "Content",
+            "threads": [
+                {
+                    "name": "Decoder",
+                    "process_name": "Content",
+                    "markers": _markers([0, 2, 1], [10.0, 20.0, 30.0])
                 }
-            }
+            ]
+        }
+    }
 
-    profile = MockProfile()
+    profile = _MockProfile(processes, string_table=string_table)
     result = extract_markers_by_name(profile, ["MarkerA", "MarkerB"])
 
     assert len(result) == 2
-    assert set(result["markerName"]) == {"MarkerA", "MarkerB"}
-    assert set(result["threadName"]) == {"Decoder"}
-    assert set(result["time"]) == {10.0, 30.0}
+    assert set(result["markerName"].unique()) == {"MarkerA", "MarkerB"}
+    assert set(result["threadName"].unique()) == {"Decoder"}
+    assert set(result["time"].unique()) == {10.0, 30.0}
     assert all(result["processName"] == "Content")
 
 def test_extract_process_by_name():
-    class MockProfile(Profile):
-        def __init__(self):
-            self.string_table = {}
-            self.processes = {
-                10: {"name": "Web Content", "threads": [
-                    {"name": "Thread1", "markers": pd.DataFrame({"name": [0], "startTime": [100.0]}), "process_name": "Web Content"}
-                ]},
-                20: {"name": "GPU", "threads": [
-                    {"name": "Thread2", "markers": pd.DataFrame({"name": [1], "startTime": [200.0]}), "process_name": "GPU"}
-                ]},
-            }
+    string_table = {}
+    processes = {
+        10: {"name": "Web Content", "threads": [
+            {"name": "Thread1", "markers": _markers([0], [100.0]), "process_name": "Web Content"}
+        ]},
+        20: {"name": "GPU", "threads": [
+            {"name": "Thread2", "markers": _markers([1], [200.0]), "process_name": "GPU"}
+        ]},
+    }
 
-    profile = MockProfile()
+    profile = _MockProfile(processes, string_table=string_table)
     extracted = extract_process(profile, name="GPU")
 
     assert isinstance(extracted, Profile)
@@ -376,15 +375,13 @@ def test_extract_process_by_name():
 
 
 def test_extract_process_by_pid():
-    class MockProfile(Profile):
-        def __init__(self):
-            self.string_table = {}
-            self.processes = {
-                10: {"name": "Web Content", "threads": []},
-                42: {"name": "Audio", "threads": []},
-            }
+    string_table = {}
+    processes = {
+        10: {"name": "Web Content", "threads": []},
+        42: {"name": "Audio", "threads": []},
+    }
 
-    profile = MockProfile()
+    profile = _MockProfile(processes, string_table=string_table)
     extracted = extract_process(profile, pid=42)
 
     assert isinstance(extracted, Profile)
@@ -392,34 +389,30 @@ def test_extract_process_by_pid():
     assert extracted.processes[42]["name"] == "Audio"
 
 def test_get_all_marker_names():
-    class MockProfile(Profile):
-        def __init__(self):
-            self.string_table = pd.Series(["A", "B", "C", "A"])  # A repeated
-            self.processes = {}
+    string_table = pd.Series(["A", "B", "C", "A"])  # A repeated
+    processes = {}
 
-    profile = MockProfile()
+    profile = _MockProfile(processes, string_table=string_table)
     result = get_all_marker_names(profile)
     assert result == ["A", "B", "C"]
 
 def test_get_all_thread_names():
-    class MockProfile(Profile):
-        def __init__(self):
-            self.processes = {
-                1: {
-                    "threads": [
-                        {"name": "Thread1"},
-                        {"name": "Thread2"}
-                    ]
-                },
-                2: {
-                    "threads": [
-                        {"name": "Thread1"},
-                        {"name": "Thread3"}
-                    ]
-                }
-            }
+    processes = {
+        1: {
+            "threads": [
+                {"name": "Thread1"},
+                {"name": "Thread2"}
+            ]
+        },
+        2: {
+            "threads": [
+                {"name": "Thread1"},
+                {"name": "Thread3"}
+            ]
+        }
+    }
 
-    profile = MockProfile()
+    profile = _MockProfile(processes)
     result = get_all_thread_names(profile)
     assert result == ["Thread1", "Thread2", "Thread3"]
 
@@ -1,41 +1,48 @@
-
 """
 Validate the logging configuration helper.
 """
 
+import io
 import logging
-import importlib
+
+import pytest
 
 import profiler_assistant.logging_config as logging_config
 
 
+@pytest.fixture(autouse=True)
 def _reset_root_logging():
-    """Utility for tests to reset logging to a known state."""
+    """Reset root logging to a known state before each test."""
     root = logging.getLogger()
     for h in list(root.handlers):
         root.removeHandler(h)
     root.setLevel(logging.NOTSET)
 
 
-def test_configure_logging_sets_warning_by_default(capsys):
-    _reset_root_logging()
-    logging_config.configure_logging("WARNING")
-    assert logging.getLogger().getEffectiveLevel() == logging.WARNING
-    out, err = capsys.readouterr()
-    assert "Logging configured to WARNING" in (out + err)
-
-
-def test_configure_logging_sets_debug(capsys):
-    _reset_root_logging()
-    logging_config.configure_logging("DEBUG")
-    assert logging.getLogger().getEffectiveLevel() == logging.DEBUG
-    out, err = capsys.readouterr()
-    assert "Logging configured to DEBUG" in (out + err)
-
-
-def test_configure_logging_invalid_level_defaults_to_warning(capsys):
-    _reset_root_logging()
-    logging_config.configure_logging("NOTALEVEL")
-    assert logging.getLogger().getEffectiveLevel() == logging.WARNING
-    out, err = capsys.readouterr()
-    assert "Logging configured to WARNING" in (out + err)
+@pytest.fixture
+def log_buffer():
+    """Collect records from the logging_config module logger into a StringIO."""
+    # configure_logging() clears the root handlers, so attach below the root.
+    buf = io.StringIO()
+    handler = logging.StreamHandler(buf)
+    logger = logging.getLogger(logging_config.__name__)
+    logger.addHandler(handler)
+    yield buf
+    logger.removeHandler(handler)
+
+
+@pytest.mark.parametrize(
+    "level_str, expected",
+    [
+        ("WARNING", logging.WARNING),
+        ("DEBUG", logging.DEBUG),
+        ("NOTALEVEL", logging.WARNING),  # invalid level defaults to WARNING
+    ],
+)
+def test_configure_logging_sets_level(log_buffer, level_str, expected):
+    logging_config.configure_logging(level_str)
+    assert logging.getLogger().getEffectiveLevel() == expected
+    assert f"Logging configured to {logging.getLevelName(expected)}" in log_buffer.getvalue()
+    # configure_logging must install a root output handler (basicConfig's StreamHandler)
+    # so users actually see the message; exact type excludes pytest's capture handlers.
+    assert any(type(h) is logging.StreamHandler for h in logging.getLogger().handlers)
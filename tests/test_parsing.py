@@ -1,84 +1,86 @@
 import pytest
-import json
+import orjson
 from pathlib import Path
-from profiler_assistant.parsing import load_and_parse_profile, Profile
+from profiler_assistant.parsing import load_and_parse_profile, parse_profile_dict, Profile
 
-@pytest.fixture
-def sample_profile_file(tmp_path):
-    """Creates a temporary sample profile.json file for testing."""
-    profile_data = {
-        "meta": {"product": "Firefox", "startTime": 1000, "endTime": 2000},
-        "stringTable": ["js", "css"],
-        "frameTable": {"schema": {"name": 0}, "data": []},
-        "stackTable": {"schema": {"frame": 0, "prefix": 1}, "data": [[0, None]]},
-        "threads": [
-            {
-                "name": "MediaThread",
-                "pid": 1234,
-                "tid": 10,
-                "processName": "Isolated Web Content",
-                "samples": {
-                    "stack": [0, 1],
-                    "timeDeltas": [10.1, 12.5],
-                    "threadCPUDelta": [100, 200],
-                    "eventDelay": [0, 1]
-                },
-                "markers": {
-                    "name": [1, 0],
-                    "startTime": [278001.123, 278005.987],
-                    "endTime": [278002.123, 278006.001],
-                    "phase": [2, 0],
-                    "category": [1, 1],
-                    "data": [{}, {}]
-                }
+SAMPLE_PROFILE_DATA = {
+    "meta": {"product": "Firefox", "startTime": 1000, "endTime": 2000},
+    "stringTable": ["js", "css"],
+    "frameTable": {"schema": {"name": 0}, "data": []},
+    "stackTable": {"schema": {"frame": 0, "prefix": 1}, "data": [[0, None]]},
+    "threads": [
+        {
+            "name": "MediaThread",
+            "pid": 1234,
+            "tid": 10,
+            "processName": "Isolated Web Content",
+            "samples": {
+                "stack": [0, 1],
+                "timeDeltas": [10.1, 12.5],
+                "threadCPUDelta": [100, 200],
+                "eventDelay": [0, 1]
             },
-            {
-                "name": "GeckoMain",
-                "pid": 4321,
-                "tid": 11,
-                "processType": "webIsolated",
-                "samples": {
-                    "stack": [],
-                    "timeDeltas": [],
-                    "threadCPUDelta": [],
-                    "eventDelay": []
-                },
-                "markers": {
-                    "name": [],
-                    "startTime": [],
-                    "endTime": [],
-                    "phase": [],
-                    "category": [],
-                    "data": []
-                }
+            "markers": {
+                "name": [1, 0],
+                "startTime": [278001.123, 278005.987],
+                "endTime": [278002.123, 278006.001],
+                "phase": [2, 0],
+                "category": [1, 1],
+                "data": [{}, {}]
+            }
+        },
+        {
+            "name": "GeckoMain",
+            "pid": 4321,
+            "tid": 11,
+            "processType": "webIsolated",
+            "samples": {
+                "stack": [],
+                "timeDeltas": [],
+                "threadCPUDelta": [],
+                "eventDelay": []
             },
-            {
-                "name": "NetworkingThread",  # <- does not match filter
-                "pid": 5555,
-                "tid": 12,
-                "processName": "Networking Process",
-                "samples": {
-                    "stack": [0],
-                    "timeDeltas": [5.0],
-                    "threadCPUDelta": [50],
-                    "eventDelay": [0]
-                },
-                "markers": {
-                    "name": [0],
-                    "startTime": [100000],
-                    "endTime": [100001],
-                    "phase": [0],
-                    "category": [1],
-                    "data": [{}]
-                }
+            "markers": {
+                "name": [],
+                "startTime": [],
+                "endTime": [],
+                "phase": [],
+                "category": [],
+                "data": []
             }
-        ]
-    }
+        },
+        {
+            "name": "NetworkingThread",  # <- does not match filter
+            "pid": 5555,
+            "tid": 12,
+            "processName": "Networking Process",
+            "samples": {
+                "stack": [0],
+                "timeDeltas": [5.0],
+                "threadCPUDelta": [50],
+                "eventDelay": [0]
+            },
+            "markers": {
+                "name": [0],
+                "startTime": [100000],
+                "endTime": [100001],
+                "phase": [0],
+                "category": [1],
+                "data": [{}]
+            }
+        }
+    ]
+}
+
 
-    file_path = tmp_path / "sample_profile.json"
-    file_path.write_text(json.dumps(profile_data))
+@pytest.fixture(scope="session")
+def sample_profile_file(tmp_path_factory):
+    """Writes the sample profile.json once per session."""
+    file_path = tmp_path_factory.mktemp("parsing") / "sample_profile.json"
+    file_path.write_bytes(orjson.dumps(SAMPLE_PROFILE_DATA))
     return file_path
 
+
 def test_load_and_parse_profile(sample_profile_file):
     """Tests loading and parsing a valid profile file."""
     profile = load_and_parse_profile(str(sample_profile_file))
@@ -110,6 +112,19 @@ def test_load_and_parse_profile(sample_profile_file):
         for thread in process["threads"]:
             assert thread["name"] != "NetworkingThread", "Filtered thread was mistakenly included"
 
+def test_parse_profile_dict_matches_file_loader(sample_profile_file):
+    """Parsing the in-memory dict yields the same processes as loading the file."""
+    from_dict = parse_profile_dict(SAMPLE_PROFILE_DATA)
+    from_file = load_and_parse_profile(str(sample_profile_file))
+
+    assert isinstance(from_dict, Profile)
+    assert from_dict.meta == from_file.meta
+    assert list(from_dict.processes) == list(from_file.processes)
+    for pid, process in from_dict.processes.items():
+        assert [t["name"] for t in process["threads"]] == [
+            t["name"] for t in from_file.processes[pid]["threads"]
+        ]
+
 def test_load_nonexistent_file():
     """Tests that a FileNotFoundError is raised for a missing file."""
     with pytest.raises(FileNotFoundError):